@@ -0,0 +1,163 @@
+import gc
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# modules that must not be pulled in by a plain "import project"
+LAZY_MODULES = ["task1", "task2", "task3", "service"]
+
+def time_python(code, repeats):
+    """
+    Runs code in a fresh interpreter several times
+
+    Args:
+        str: python source passed to -c
+        int: number of runs
+    Returns:
+        float: fastest run in milliseconds
+    """
+    best = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_DIR, check=True)
+        elapsed = (time.perf_counter() - start_time) * 1000
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def eagerly_imported_modules():
+    """Returns the stage modules loaded as a side effect of importing project"""
+    code = (
+        "import sys, project; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_DIR,
+                            check=True, capture_output=True, text=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+def benchmark_startup(repeats=5, max_ms=50.0):
+    """
+    Compares importing project against a bare interpreter start and fails
+    if the import runs any stage or costs more than max_ms.
+    """
+    baseline_ms = time_python("pass", repeats)
+    import_ms = time_python("import project", repeats)
+    overhead_ms = import_ms - baseline_ms
+    print(f"interpreter: {baseline_ms:.1f} ms")
+    print(f"import project: {import_ms:.1f} ms (+{overhead_ms:.1f} ms)")
+
+    loaded = eagerly_imported_modules()
+    if loaded:
+        raise SystemExit(f"import project also imported: {', '.join(loaded)}")
+    if overhead_ms > max_ms:
+        raise SystemExit(f"import project costs {overhead_ms:.1f} ms, budget is {max_ms:.1f} ms")
+    print("Startup benchmark passed.")
+
+def _quality_inputs(size, seed=0):
+    """Generates birthdates, competition dates and athlete/game tables with some bad values mixed in"""
+    rng = random.Random(seed)
+    months = ["Jan", "February", "Mar", "April", "May", "Jun", "July", "Aug", "September", "Oct", "Nov", "December"]
+    births = []
+    for _ in range(size):
+        day, month, year = rng.randint(1, 28), rng.choice(months), rng.randint(1860, 2005)
+        if rng.random() < 0.05:
+            births.append(rng.choice([f"c. {year}", f"{year}?", f"{day}/{month}/{year}"]))
+        else:
+            births.append(rng.choice([
+                f"{day} {month} {year}", f"{day:02d}-{month[:3]}-{year % 100:02d}", str(year),
+                "", f"{month} {year}",
+            ]))
+
+    games_date = {f"{year} Summer": "6 July – 12 August" for year in range(1896, 2024, 4)}
+    competition_dates = [(rng.choice(["6 – 13 April", "14 May – 28 October", "1 July – 26 November", "—"]), "1900")
+                         for _ in range(size)]
+    athlete_info = {}
+    for athlete_id in range(size):
+        first_games = rng.randint(474, 504) * 4
+        birth = [str(rng.randint(1, 28)), rng.choice(months), str(first_games - rng.randint(8, 40))]
+        games = [f"{first_games + 4 * i} Summer" for i in range(3)] #a few of these are unknown
+        athlete_info[str(athlete_id)] = birth + games
+    return births, competition_dates, games_date, athlete_info
+
+def _cleaning_loops(inputs, quality):
+    """The three loops that collect quality metrics, as (name, callable) pairs"""
+    from task2 import DataCleaner
+    from task3 import add_athlete_to_games_dict
+    births, competition_dates, games_date, athlete_info = inputs
+    cleaner = DataCleaner(quality)
+
+    def clean_births():
+        for value in births:
+            cleaner.clean_birthdate(value)
+
+    def clean_competition_dates():
+        for value, year in competition_dates:
+            cleaner.clean_competition_date(value, year)
+
+    def calculate_ages():
+        add_athlete_to_games_dict(games_date, athlete_info, quality)
+
+    return [("births", clean_births), ("competition dates", clean_competition_dates), ("ages", calculate_ages)]
+
+def _paired_ratio(plain, tracked, repeats):
+    """
+    Runs plain and tracked back to back, swapping which goes first each time.
+
+    Returns:
+        tuple: median tracked/plain ratio of the pairs and the fastest plain run (ms)
+    """
+    ratios = []
+    plain_best = None
+    for i in range(repeats):
+        timings = {}
+        order = [("plain", plain), ("tracked", tracked)]
+        for label, loop in order if i % 2 == 0 else reversed(order):
+            start_time = time.perf_counter()
+            loop()
+            timings[label] = (time.perf_counter() - start_time) * 1000
+        ratios.append(timings["tracked"] / timings["plain"])
+        plain_best = timings["plain"] if plain_best is None else min(plain_best, timings["plain"])
+    return statistics.median(ratios), plain_best
+
+def benchmark_quality_overhead(repeats=31, max_percent=5.0, size=2000):
+    """
+    Times the birthdate, competition date and age loops with and without a
+    QualityReport and fails if collecting the metrics costs more than max_percent.
+
+    Machine noise here is larger than the cost being measured, so each loop is
+    run as many short back-to-back pairs with the garbage collector off and the
+    median pair ratio is kept; the loops are then weighted by their run time.
+    """
+    from quality import QualityReport
+    inputs = _quality_inputs(size)
+    plain_loops = _cleaning_loops(inputs, None)
+    tracked_loops = _cleaning_loops(inputs, QualityReport())
+    plain_ms = 0.0
+    tracked_ms = 0.0
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for (name, plain), (_, tracked) in zip(plain_loops, tracked_loops):
+            ratio, plain_best = _paired_ratio(plain, tracked, repeats)
+            print(f"  {name}: {plain_best:.1f} ms, with quality metrics: {ratio - 1:+.1%}")
+            plain_ms += plain_best
+            tracked_ms += plain_best * ratio
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    overhead_percent = (tracked_ms - plain_ms) / plain_ms * 100
+    print(f"cleaning loops: {plain_ms:.1f} ms, with quality metrics: {tracked_ms:.1f} ms ({overhead_percent:+.1f}%)")
+    if overhead_percent > max_percent:
+        raise SystemExit(f"quality metrics cost {overhead_percent:.1f}%, budget is {max_percent:.1f}%")
+    print("Quality overhead benchmark passed.")
+
+if __name__ == "__main__":
+    benchmark_startup()
+    benchmark_quality_overhead()
@@ -0,0 +1,144 @@
+import csv
+import glob
+import os
+import re
+from collections import OrderedDict
+
+PARTITION_DIR = "new_olympic_athlete_event_results"
+PARTITION_INDEX = "index.csv"
+PARTITION_MODES = ["edition", "decade"]
+MAX_OPEN_FILES = 32
+INDEX_HEADERS = ["partition", "file", "rows", "data_offset", "bytes"]
+
+def edition_partition(edition):
+    """'1896 Summer Olympics' -> '1896_summer_olympics'"""
+    name = re.sub(r"[^0-9A-Za-z]+", "_", edition).strip("_").lower()
+    return name or "unknown"
+
+def decade_partition(edition):
+    """'1896 Summer Olympics' -> '1890s'"""
+    year = edition.strip().split(" ")[0]
+    if len(year) == 4 and year.isdigit():
+        return f"{year[:3]}0s"
+    return "unknown"
+
+PARTITIONERS = {
+    "edition": edition_partition,
+    "decade": decade_partition,
+}
+
+def clear_partitions(directory):
+    """
+    Prepares directory for a new partitioned run. If it already holds an
+    index.csv every *.csv in it is a partition from an earlier run and is
+    deleted. A directory with other csv files but no index is refused, so a
+    wrong --partition-dir never deletes unrelated data. An empty index is
+    written straight away to mark the directory as ours even if the run fails.
+    """
+    os.makedirs(directory, exist_ok=True)
+    index_path = os.path.join(directory, PARTITION_INDEX)
+    old_files = glob.glob(os.path.join(directory, "*.csv"))
+    if old_files and not os.path.exists(index_path):
+        raise ValueError(f"'{directory}' has csv files but no {PARTITION_INDEX}, refusing to clear it")
+    for path in old_files:
+        os.remove(path)
+
+    with open(index_path, "w", newline="", encoding="utf-8") as index_file:
+        csv.writer(index_file).writerow(INDEX_HEADERS)
+
+# --------------------------------------------------------------
+# CLASS: PartitionedWriter
+# --------------------------------------------------------------
+class PartitionedWriter:
+    """
+    Writes event result rows into one csv per edition (or per decade) and an
+    index file listing each partition with its row count and byte offsets.
+
+    Partition files left in the directory by an earlier run are removed first,
+    so the directory only ever holds the partitions listed in its index.
+
+    Open file handles are kept in a bounded LRU pool: when more than max_open
+    partitions are active the least recently used file is closed and later
+    reopened in append mode, so large runs never exhaust file descriptors.
+    """
+
+    def __init__(self, directory, fieldnames, partition_by="edition",
+                 edition_column="edition", max_open=MAX_OPEN_FILES):
+        if partition_by not in PARTITIONERS:
+            raise ValueError(f"partition_by must be one of {PARTITION_MODES}, not {partition_by!r}")
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self.directory = directory
+        self.fieldnames = fieldnames
+        self.partitioner = PARTITIONERS[partition_by]
+        self.edition_column = edition_column
+        self.max_open = max_open
+        self.handles = OrderedDict() #partition -> (file, DictWriter), least recently used first
+        self.rows = {}               #partition -> rows written
+        self.data_offsets = {}       #partition -> byte offset of the first data row
+        clear_partitions(directory)
+
+    def path(self, partition):
+        return os.path.join(self.directory, f"{partition}.csv")
+
+    def writerow(self, row):
+        partition = self.partitioner(row[self.edition_column])
+        self._writer(partition).writerow(row)
+        self.rows[partition] += 1
+
+    def _writer(self, partition):
+        if partition in self.handles:
+            self.handles.move_to_end(partition)
+            return self.handles[partition][1]
+
+        if len(self.handles) >= self.max_open:
+            _, (old_file, _) = self.handles.popitem(last=False)
+            old_file.close()
+
+        first_open = partition not in self.rows
+        outfile = open(self.path(partition), "w" if first_open else "a", newline="", encoding="utf-8")
+        writer = csv.DictWriter(outfile, fieldnames=self.fieldnames)
+        if first_open:
+            writer.writeheader()
+            outfile.flush()
+            self.data_offsets[partition] = outfile.buffer.tell()
+            self.rows[partition] = 0
+        self.handles[partition] = (outfile, writer)
+        return writer
+
+    def close(self):
+        """Closes every open partition and writes the index file"""
+        self.close_files()
+        return self.write_index()
+
+    def close_files(self):
+        while self.handles:
+            _, (outfile, _) = self.handles.popitem(last=False)
+            outfile.close()
+
+    def write_index(self):
+        index_path = os.path.join(self.directory, PARTITION_INDEX)
+        with open(index_path, "w", newline="", encoding="utf-8") as index_file:
+            writer = csv.writer(index_file)
+            writer.writerow(INDEX_HEADERS)
+            for partition in sorted(self.rows):
+                path = self.path(partition)
+                writer.writerow([partition, os.path.basename(path), self.rows[partition],
+                                 self.data_offsets[partition], os.path.getsize(path)])
+        return index_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        #a failed run keeps the empty index written by clear_partitions,
+        #so its half-written partitions are never listed
+        if exc_type is None:
+            self.close()
+        else:
+            self.close_files()
+
+def read_partition_index(directory=PARTITION_DIR):
+    """Returns the index rows as dictionaries so consumers can pick their partitions"""
+    with open(os.path.join(directory, PARTITION_INDEX), newline="", encoding="utf-8") as index_file:
+        return list(csv.DictReader(index_file))
@@ -1,105 +1,118 @@
-import csv
-import os
-from task1 import task1_main
-from task2 import task2_main
-from task3 import task3_main 
-from typing import Iterable, List
-
-# friendly names for csv's
-ORIGINAL_BIO = "olympic_athlete_bio.csv"
-ORIGINAL_EVENTS = "olympic_athlete_event_results.csv"
-ORIGINAL_COUNTRY = "olympics_country.csv"
-ORIGINAL_GAMES = "olympics_games.csv"
-
-#NOT ALL JUST FOR TESTING
-PARIS_ATHLETES = os.path.join("paris", "athletes.csv")
-PARIS_MEDALLISTS = os.path.join("paris", "medallists.csv")
-PARIS_NOCS = os.path.join("paris", "nocs.csv")
-
-NEW_BIO = "new_olympic_athlete_bio.csv"
-NEW_EVENTS = "new_olympic_athlete_event_results.csv"
-NEW_COUNTRY = "new_olympics_country.csv"
-NEW_GAMES = "new_olympics_games.csv"
-NEW_TALLY = "new_medal_tally.csv"
-
-TALLY_HEADER = [
-    "edition",
-    "edition_id",
-    "Country",
-    "NOC",
-    "number_of_athletes",
-    "gold_medal_count",
-    "silver_medal_count",
-    "bronze_medal_count",
-    "total_medals",
-]
-
-def read_csv(path: str) -> List[List[str]]:
-    if not os.path.exists(path):
-        return []
-    with open(path, newline="", encoding="utf-8") as fh:
-        return list(csv.reader(fh))
-
-def write_csv(path: str, rows: Iterable[Iterable[str]]) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.writer(fh)
-        for row in rows:
-            writer.writerow(list(row))
-
-#new func added FOR TESTING
-def validate_paris_files() -> None:
-    paris_files = {
-        "athletes": PARIS_ATHLETES,
-        "medallists": PARIS_MEDALLISTS,
-        "nocs": PARIS_NOCS,
-    }
-    for name, path in paris_files.items():
-        rows = read_csv(path)
-        if not rows:
-            print(f"[warn] Paris {name} missing or empty: {path}")
-        else:
-            print(f"[ok] Paris {name} has {len(rows)-1} data rows (header excluded).")
-
-def with_age_column(event_rows: List[List[str]]) -> List[List[str]]:
-    if not event_rows:
-        return [["age"]]
-    header = list(event_rows[0])
-    header_lower = [h.strip().lower() for h in header]
-    if "age" not in header_lower:
-        header.append("age")
-    result: List[List[str]] = [header]
-    for row in event_rows[1:]:
-        result.append(list(row) + [""])
-    return result
-
-def build_new_outputs() -> None:
-    # keep baseline behavior
-    bio_rows = read_csv(ORIGINAL_BIO)
-    write_csv(NEW_BIO, bio_rows if bio_rows else [])
-
-    event_rows = read_csv(ORIGINAL_EVENTS)
-    if event_rows:
-        write_csv(NEW_EVENTS, with_age_column(event_rows))
+import argparse
+import importlib
+from typing import List
+
+# stage name -> (module, entry function, collects data-quality metrics)
+# modules are only imported when their stage runs, so importing this file is cheap
+STAGES = {
+    "task1": ("task1", "task1_main", False),
+    "task2": ("task2", "task2_main", True),
+    "task3": ("task3", "task3_main", True),
+}
+
+def run_stage(name: str, quality=None, **options) -> None:
+    module_name, func_name, collects_quality = STAGES[name]
+    module = importlib.import_module(module_name)
+    if collects_quality:
+        getattr(module, func_name)(quality, **options)
     else:
-        write_csv(NEW_EVENTS, [["age"]])
+        getattr(module, func_name)(**options)
+
+def stage_options(name: str, args: argparse.Namespace) -> dict:
+    """Extra keyword arguments a stage takes from the command line"""
+    if name != "task3" or not getattr(args, "partition", None):
+        return {}
+    options = {"partition_by": args.partition, "max_open": args.max_open_files}
+    if args.partition_dir:
+        options["partition_dir"] = args.partition_dir
+    return options
+
+def run_stages(names: List[str], args: argparse.Namespace) -> None:
+    quality = None
+    if args.quality_report:
+        from quality import QualityReport
+        quality = QualityReport()
+    for name in names:
+        run_stage(name, quality, **stage_options(name, args))
+    collected = [name for name in names if STAGES[name][2]]
+    if quality is not None and collected:
+        quality.write(args.quality_report, collected)
+
+def run_all(args: argparse.Namespace) -> None:
+    run_stages(list(STAGES), args)
+
+def run_serve(args: argparse.Namespace) -> None:
+    from service import serve
+    serve(args.host, args.port, seed_tally=args.seed_tally)
+
+def run_bench(args: argparse.Namespace) -> None:
+    from bench import benchmark_quality_overhead, benchmark_startup
+    benchmark_startup(repeats=args.repeats, max_ms=args.max_ms)
+    benchmark_quality_overhead(repeats=args.quality_repeats, max_percent=args.max_overhead_percent)
 
-    country_rows = read_csv(ORIGINAL_COUNTRY)
-    write_csv(NEW_COUNTRY, country_rows if country_rows else [])
+def add_partition_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--partition", choices=["edition", "decade"],
+                        help="write the event results as one file per edition or decade plus an index")
+    parser.add_argument("--partition-dir",
+                        help="directory for the partition files (default: new_olympic_athlete_event_results)")
+    parser.add_argument("--max-open-files", type=int, default=32,
+                        help="partition files kept open at once (default: %(default)s)")
 
-    games_rows = read_csv(ORIGINAL_GAMES)
-    write_csv(NEW_GAMES, games_rows if games_rows else [])
+def run_verify(args: argparse.Namespace) -> None:
+    from verify import verify
+    verify(examples=args.examples, seed=args.seed, max_slowdown=args.max_slowdown, repeats=args.repeats)
 
-def write_tally_header() -> None:
-    write_csv(NEW_TALLY, [TALLY_HEADER])
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Olympic data parsing and cleaning pipeline")
+    parser.add_argument("--quality-report", default="data_quality_report.json",
+                        help="where to write the data-quality report (default: %(default)s)")
+    parser.add_argument("--no-quality-report", dest="quality_report", action="store_const", const="",
+                        help="skip collecting data-quality metrics")
+    subparsers = parser.add_subparsers(dest="command")
 
-def main() -> None:
-    print("Stage B: validating Paris sources...")
-    validate_paris_files()
-    build_new_outputs()
-    write_tally_header()
-    print("Stage B complete.")
+    for name in STAGES:
+        stage = subparsers.add_parser(name, help=f"run {name} only")
+        stage.set_defaults(func=lambda args, name=name: run_stages([name], args))
+        if name == "task3":
+            add_partition_arguments(stage)
+
+    run_everything = subparsers.add_parser("all", help="run every task in order (default)")
+    add_partition_arguments(run_everything)
+    run_everything.set_defaults(func=run_all)
+
+    serve = subparsers.add_parser("serve", help="run the local enrichment service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--seed-tally", action="store_true",
+                       help="start the running tally from the existing event results file")
+    serve.set_defaults(func=run_serve)
+
+    bench = subparsers.add_parser("bench", help="measure startup cost and data-quality overhead")
+    bench.add_argument("--repeats", type=int, default=5)
+    bench.add_argument("--max-ms", type=float, default=50.0,
+                       help="fail if importing project costs more than this over a bare interpreter")
+    bench.add_argument("--quality-repeats", type=int, default=31,
+                       help="back-to-back timed pairs per cleaning loop (default: %(default)s)")
+    bench.add_argument("--max-overhead-percent", type=float, default=5.0,
+                       help="fail if collecting data-quality metrics slows the cleaning loops more than this")
+    bench.set_defaults(func=run_bench)
+
+    check = subparsers.add_parser("verify", help="compare the date and age logic against the frozen reference")
+    check.add_argument("--examples", type=int, default=2000, help="generated inputs per hot path")
+    check.add_argument("--seed", type=int, default=0)
+    check.add_argument("--repeats", type=int, default=5)
+    check.add_argument("--max-slowdown", type=float, default=1.5,
+                       help="fail if a hot path is this many times slower than the reference")
+    check.set_defaults(func=run_verify)
+
+    return parser
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        run_all(args)
+    else:
+        args.func(args)
 
 if __name__ == "__main__":
-    task1_main()
-    task2_main()
-    task3_main()
+    main()
@@ -0,0 +1,105 @@
+import json
+import os
+import random
+import re
+
+QUALITY_REPORT_FILE = "data_quality_report.json"
+MIN_PLAUSIBLE_AGE = 10
+MAX_PLAUSIBLE_AGE = 80
+
+#stage -> report categories it fills, so a partial run only replaces its own findings
+STAGE_CATEGORIES = {
+    "task2": ["unparseable_birthdate", "unparseable_competition_date"],
+    "task3": ["missing_noc", "unknown_edition", "age_not_calculated", "event_without_age", "implausible_age"],
+}
+
+_DIGIT = re.compile(r"\d")
+_LETTERS = re.compile(r"[^\W\d_]+")
+
+def date_shape(value):
+    """
+    Reduces a raw date to its format shape so similar failures are grouped:
+    every digit becomes '9' and every run of letters becomes 'a'.
+        '04-Apr-49'        -> '99-a-99'
+        '24 November 1873' -> '99 a 9999'
+    """
+    return _LETTERS.sub("a", _DIGIT.sub("9", str(value).strip()))
+
+# --------------------------------------------------------------
+# CLASS: QualityReport
+# --------------------------------------------------------------
+class QualityReport:
+    """
+    Counts data-quality problems while the cleaning loops run and keeps a
+    small reservoir sample of example values for each kind of problem.
+
+    Categories used by the pipeline:
+      - unparseable_birthdate / unparseable_competition_date (keyed by date shape)
+      - missing_noc (keyed by the noc that has no country)
+      - unknown_edition (keyed by the game name)
+      - age_not_calculated (keyed by 'missing_birth', 'partial_birth' or 'unknown_month')
+      - event_without_age (event rows left with a blank or N/A age, keyed by cause)
+      - implausible_age (keyed by 'negative', 'under_10' or 'over_80')
+    """
+
+    def __init__(self, sample_size=5, seed=0):
+        self.sample_size = sample_size
+        self.counts = {}  #category -> {key: count}
+        self.samples = {} #category -> {key: [examples]}
+        self.random = random.Random(seed)
+
+    def record(self, category, key, example):
+        """Counts one problem and offers its example to the reservoir (algorithm R)"""
+        counts = self.counts.setdefault(category, {})
+        seen = counts.get(key, 0) + 1
+        counts[key] = seen
+
+        samples = self.samples.setdefault(category, {}).setdefault(key, [])
+        if len(samples) < self.sample_size:
+            samples.append(example)
+        else:
+            slot = self.random.randrange(seen)
+            if slot < self.sample_size:
+                samples[slot] = example
+
+    def record_age(self, age, athlete_id, game):
+        """Records the age if it is negative or outside the plausible range"""
+        if MIN_PLAUSIBLE_AGE <= age <= MAX_PLAUSIBLE_AGE:
+            return
+        if age < 0:
+            key = "negative"
+        elif age < MIN_PLAUSIBLE_AGE:
+            key = f"under_{MIN_PLAUSIBLE_AGE}"
+        else:
+            key = f"over_{MAX_PLAUSIBLE_AGE}"
+        self.record("implausible_age", key, f"{athlete_id} @ {game}: {age}")
+
+    def to_dict(self):
+        report = {}
+        for category, counts in self.counts.items():
+            report[category] = {
+                "total": sum(counts.values()),
+                "by_key": {
+                    key: {"count": count, "examples": self.samples[category][key]}
+                    for key, count in sorted(counts.items(), key=lambda item: -item[1])
+                },
+            }
+        return report
+
+    def write(self, filename=QUALITY_REPORT_FILE, stages=None):
+        """
+        Writes the report. When stages is given the existing report is kept
+        and only the categories those stages fill are replaced.
+        """
+        report = {}
+        if stages is not None and os.path.exists(filename):
+            with open(filename, encoding="utf-8") as fh:
+                report = json.load(fh)
+            for stage in stages:
+                for category in STAGE_CATEGORIES.get(stage, []):
+                    report.pop(category, None)
+        report.update(self.to_dict())
+
+        with open(filename, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+        print(f"Data quality report '{filename}' created successfully.")
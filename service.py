@@ -0,0 +1,214 @@
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from task3 import (
+    EDITION_COLUMN,
+    athlete_age_for_game,
+    create_birth_dict,
+    create_games_dict,
+    normalize_game_name,
+    parse_olympics_country,
+    tally_event_info,
+    tally_event_row,
+    tally_rows,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+COUNT_KEYS = [
+    "number_of_athletes",
+    "gold_medal_count",
+    "silver_medal_count",
+    "bronze_medal_count",
+    "total_medals",
+]
+
+# --------------------------------------------------------------
+# CLASS: OlympicIndex
+# --------------------------------------------------------------
+class OlympicIndex:
+    """
+    Keeps the country, games and athlete birth tables in memory so that
+    new event result rows can be enriched without re-reading the csv files.
+    """
+
+    def __init__(self, seed_tally=False):
+        self.countries = parse_olympics_country()
+        self.games = create_games_dict()
+        self.births = create_birth_dict()
+        #Starting from the existing event file means reading all of it once
+        self.tally = tally_event_info(self.countries) if seed_tally else {}
+        self.lock = threading.Lock()
+
+    def athlete_age(self, row):
+        """
+        Returns the age of the athlete in the row during its game, or "N/A"
+        if the athlete, the game or the dates are not known.
+        """
+        game = normalize_game_name(row[EDITION_COLUMN])
+        athlete_birth = self.births.get(str(row["athlete_id"]))
+        if athlete_birth is None or game not in self.games:
+            return "N/A"
+        try:
+            return athlete_age_for_game(self.games, athlete_birth[:3], game)
+        except (ValueError, IndexError, KeyError):
+            return "N/A" #Failed calculate age due to bad data
+
+    def add_events(self, rows):
+        """
+        Enriches a batch of event result rows with the athlete age and adds
+        them to the running medal tally.
+
+        Args:
+            lst[dict]: event result rows, keyed like olympic_athlete_event_results.csv
+        Returns:
+            tuple: enriched rows, and the tally increments caused by the batch as summary rows
+        """
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("rows must be a list of objects")
+        rows = [_with_edition_column(row) for row in rows]
+        enriched = []
+        delta = {}
+        for row in rows:
+            new_row = dict(row)
+            new_row["age"] = self.athlete_age(row)
+            enriched.append(new_row)
+            tally_event_row(delta, row, self.countries)
+
+        with self.lock:
+            for tally_key, summary_info in delta.items():
+                if tally_key not in self.tally:
+                    self.tally[tally_key] = dict(summary_info)
+                    continue
+                for key in COUNT_KEYS:
+                    self.tally[tally_key][key] += summary_info[key]
+
+        return [_without_edition_column(row) for row in enriched], tally_rows(delta)
+
+    def tally_snapshot(self):
+        """Returns the running tally as summary rows sorted by (edition_id, NOC)"""
+        with self.lock:
+            return tally_rows(self.tally)
+
+def _with_edition_column(row):
+    #Clients send plain "edition", the event file header carries the BOM
+    if EDITION_COLUMN not in row and "edition" in row:
+        row = dict(row)
+        row[EDITION_COLUMN] = row.pop("edition")
+    return row
+
+def _without_edition_column(row):
+    if EDITION_COLUMN in row:
+        row["edition"] = row.pop(EDITION_COLUMN)
+    return row
+
+# --------------------------------------------------------------
+# CLASS: ServiceHandler
+# --------------------------------------------------------------
+class ServiceHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests sent to the service:
+      - GET  /health  -> number of loaded athletes, games and countries
+      - GET  /tally   -> the running medal tally, as TALLY_HEADERS rows
+      - POST /events  -> {"rows": [...]} enriched with age, plus tally delta rows
+    """
+
+    def do_GET(self):
+        index = self.server.index
+        if self.path == "/health":
+            self._send_json(200, {
+                "athletes": len(index.births),
+                "games": len(index.games),
+                "countries": len(index.countries),
+            })
+        elif self.path == "/tally":
+            self._send_json(200, {"tally": index.tally_snapshot()})
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/events":
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+
+        start_time = time.perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            rows, delta = self.server.index.add_events(body.get("rows", []))
+        except (ValueError, KeyError, AttributeError, TypeError) as error:
+            self._send_json(400, {"error": f"bad event rows: {error!r}"})
+            return
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self._send_json(200, {"rows": rows, "tally_delta": delta, "elapsed_ms": round(elapsed_ms, 3)})
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        #Keep the console quiet, one line per request is too slow for small batches
+        pass
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, index=None):
+    """Creates the http server, loading the reference tables once"""
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.index = index if index is not None else OlympicIndex()
+    return server
+
+def start_in_thread(host=DEFAULT_HOST, port=0, index=None):
+    """
+    Starts the service on a background thread, port 0 picks a free port.
+    Call server.shutdown() to stop it.
+    """
+    server = create_server(host, port, index)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, seed_tally=False):
+    server = create_server(host, port, OlympicIndex(seed_tally=seed_tally))
+    print(f"Serving on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+# --------------------------------------------------------------
+# CLASS: ServiceClient
+# --------------------------------------------------------------
+class ServiceClient:
+    """Small local client used to drive a running service"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=10):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def health(self):
+        return self._request("GET", "/health")
+
+    def tally(self):
+        return self._request("GET", "/tally")["tally"]
+
+    def send_events(self, rows):
+        return self._request("POST", "/events", {"rows": list(rows)})
+
+    def _request(self, method, path, payload=None):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method=method)
+        request.add_header("Content-Type", "application/json")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+if __name__ == "__main__":
+    serve()
@@ -1,7 +1,5 @@
 import csv
 import os
-from task2 import task2_main
-from task3 import task3_main 
 from typing import Iterable, List
 
 # friendly names for csv's
@@ -1,5 +1,6 @@
 import csv
 from datetime import datetime
+from quality import date_shape
 
 
 # --------------------------------------------------------------
@@ -10,8 +11,13 @@ class DataCleaner:
     Responsible for all data cleaning logic.
     - clean_birthdate: fixes the 'born' column in olympic_athlete_bio.csv
     - clean_competition_date: fixes the 'competition_date' column in olympics_games.csv
+
+    If a QualityReport is given, values that cannot be parsed are recorded in it.
     """
 
+    def __init__(self, quality=None):
+        self.quality = quality
+
     def clean_birthdate(self, date_str):
         """
         Clean a raw birthdate string into the format dd-Mon-yyyy.
@@ -114,10 +120,10 @@ class DataCleaner:
                 dt = datetime(year, 1, 1)
                 return dt.strftime("%d-%b-%Y")
             except ValueError:
-                return ""
+                return self._unparseable("unparseable_birthdate", s)
 
         # If none of the patterns match, treat as missing.
-        return ""
+        return self._unparseable("unparseable_birthdate", s)
 
     def clean_competition_date(self, date_str, year):
         """
@@ -142,6 +148,10 @@ class DataCleaner:
 
         raw = str(date_str).strip()
 
+        # A dash on its own means "no dates", treat it like any other missing marker
+        if raw in ["-", "–", "—", "−"]:
+            return ""
+
         # Normalise all dash-like characters to a simple hyphen
         #    The file uses en dash, em dash, minus sign, etc.
         for dash in ["–", "—", "−"]:
@@ -157,7 +167,10 @@ class DataCleaner:
 
         # If there's no ' to ', treat as a single date
         if " to " not in raw:
-            return self._format_single_date(raw, year)
+            single_clean = self._format_single_date(raw, year)
+            if not single_clean:
+                return self._unparseable("unparseable_competition_date", date_str)
+            return single_clean
 
         # Split into start and end parts (once)
         start_str, end_str = raw.split(" to ", 1)
@@ -178,10 +191,16 @@ class DataCleaner:
 
         # If either side fails, treat as missing
         if not start_clean or not end_clean:
-            return ""
+            return self._unparseable("unparseable_competition_date", date_str)
 
         return f"{start_clean} to {end_clean}"
 
+    def _unparseable(self, category, value):
+        """Records a value that could not be parsed and returns the empty result"""
+        if self.quality is not None:
+            self.quality.record(category, date_shape(value), str(value))
+        return ""
+
     def _format_single_date(self, s, year):
         """
         Helper for competition dates.
@@ -212,8 +231,8 @@ class FileProcessor:
     to the DataCleaner class.
     """
 
-    def __init__(self):
-        self.cleaner = DataCleaner()
+    def __init__(self, quality=None):
+        self.cleaner = DataCleaner(quality)
 
     def process_athlete_bio(self, input_file, output_file):
         """
@@ -264,8 +283,8 @@ class FileProcessor:
 # --------------------------------------------------------------
 # MAIN FUNCTION
 # --------------------------------------------------------------
-def task2_main():
-    processor = FileProcessor()
+def task2_main(quality=None):
+    processor = FileProcessor(quality)
 
     processor.process_athlete_bio(
         "olympic_athlete_bio.csv",
@@ -284,4 +303,4 @@ def task2_main():
 # RUN MAIN
 # --------------------------------------------------------------
 if __name__ == "__main__":
-    main()
+    task2_main()
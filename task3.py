@@ -1,10 +1,19 @@
 import csv
+import heapq
 import itertools as itr
+import os
 from datetime import datetime
+from partition import MAX_OPEN_FILES, PARTITION_DIR, PartitionedWriter
+from quality import MAX_PLAUSIBLE_AGE, MIN_PLAUSIBLE_AGE
 ATHLETE_EVENT_FILE = "olympic_athlete_event_results.csv"
 ATHLETE_BIO_FILE = "olympic_athlete_bio.csv"
 OLYMPIC_GAMES_FILE = "olympics_games.csv"
 OLYMPIC_COUNTRIES = "olympics_country.csv"
+TALLY_FILE = "new_medal_tally.csv"
+TALLY_HEADERS = ["edition", "edition_id", "Country", "NOC", "number_of_athletes", 
+                 "gold_medal_count", "silver_medal_count", "bronze_medal_count", "total_medals"]
+WRITE_BATCH_SIZE = 1000 #rows handed to writerows at a time
+EDITION_COLUMN = "\ufeffedition" #first header of the event file keeps the utf-8 BOM
 MONTHS = {
     "jan": 1, "january": 1,
     "feb": 2, "february": 2,
@@ -27,42 +36,59 @@ MONTHS = {
 def normalize_game_name(name):
     return name.replace("Olympics", "").replace("Games", "").strip()
 
-def create_age_dict():
+def create_age_dict(athlete_birth=None):
     """
     Creates a dictionary containing the athleet id as key, and a list with the atlete date of birth, 
     and all thr games they have participated in
 
     Args:
-
+        dict: optional athlete birth parts from create_birth_dict, left unchanged
     Returns:
         dictionary of athlete info
     """
-    athlete_info = {} #will contains index 0 : athlete id, 1 - 3 : mm/dd/yy, 4 - onward : games played in
+    if athlete_birth is None:
+        athlete_birth = create_birth_dict()
+    #will contains index 0 : athlete id, 1 - 3 : mm/dd/yy, 4 - onward : games played in
+    athlete_info = {id: list(birth) for id, birth in athlete_birth.items()}
+
+    with open(ATHLETE_EVENT_FILE, 'r', encoding="utf-8") as eventCSV:
+        eventCSV.readline() #skips first line
+        reader = csv.reader(eventCSV)
+        for row in reader:
+            #Adds the games the athlete participates in after 3rd index
+            if row[7] in athlete_info:
+                normalized_game = normalize_game_name(row[0]) # fix name
+                athlete_info[row[7]].append(normalized_game)
+
+    return athlete_info
+
+def create_birth_dict():
+    """
+    Creates a dictionary containing the athlete id as key, and the athlete date of birth
+    split into its day, month and year parts
+
+    Args:
+
+    Returns:
+        dict: athlete birth parts
+    """
+    athlete_birth = {}
     with open(ATHLETE_BIO_FILE, 'r', encoding="utf-8") as bioCSV:
         reader = csv.reader(bioCSV) 
         bioCSV.readline() #skips first line
         for row in reader:
             #Adds all the atheltes id and born column into a dictionary
-            athlete_info[row[0]] = row[3]
+            athlete_birth[row[0]] = row[3]
 
-    for id, value in athlete_info.items():
+    for id, value in athlete_birth.items():
         #splits based on the format of the born column
         if '-' in value:
             year = value.split('-')
         else:
             year = value.split(' ')
-        athlete_info[id] = year
-
-    with open(ATHLETE_EVENT_FILE, 'r', encoding="utf-8") as eventCSV:
-        eventCSV.readline() #skips first line
-        reader = csv.reader(eventCSV)
-        for row in reader:
-            #Adds the games the athlete participates in after 3rd index
-            if row[7] in athlete_info:
-                normalized_game = normalize_game_name(row[0]) # fix name
-                athlete_info[row[7]].append(normalized_game)
+        athlete_birth[id] = year
 
-    return athlete_info
+    return athlete_birth
 
 def create_games_dict():
     """
@@ -134,7 +160,7 @@ def calculate_age(game_duration, athlete_birth, game_year):
 
     return age
 
-def add_athlete_to_games_dict(games_date, athlete_info):
+def add_athlete_to_games_dict(games_date, athlete_info, quality=None, athlete_births=None):
     """
     Creates a dictionary containt olympic games as the key and a dictionary of athletes ids and 
     there age corresponsgin to that game as the items
@@ -143,6 +169,8 @@ def add_athlete_to_games_dict(games_date, athlete_info):
         str: Game date duration
         lst[str]: athlete birthday
         str: olympic game containing year
+        QualityReport: optional, records unknown games and bad or implausible ages
+        dict: optional raw birth parts from create_birth_dict, used to explain failed ages
     Returns:
         dict: olypmic games and coressponding athlete ages
     """
@@ -154,47 +182,112 @@ def add_athlete_to_games_dict(games_date, athlete_info):
 
         for i in range(3, len(athletes_birth_and_games)): #Games begin at index 3
             if athletes_birth_and_games[i] not in games_date:
-                #print(f"WARNING: Game '{athletes_birth_and_games[i]}' not found in games_date.")
-                pass
+                if quality is not None:
+                    quality.record("unknown_edition", athletes_birth_and_games[i], athlete_id)
             else:
-                game_duration = games_date[athletes_birth_and_games[i]]
                 athlete_birth = athletes_birth_and_games[:3] #Athlete birth from index 0 - 2
                 game_year = athletes_birth_and_games[i]
-                athlete_age = calculate_age(game_duration, athlete_birth, game_year)
-                if athlete_age == 0:
-                    athlete_age_during_game[athletes_birth_and_games[i]][athlete_id] = "N/A"
-                else:
-                    athlete_age_during_game[athletes_birth_and_games[i]][athlete_id] = athlete_age   
+                athlete_age = athlete_age_for_game(games_date, athlete_birth, game_year)
+                athlete_age_during_game[game_year][athlete_id] = athlete_age
+                if quality is None:
+                    continue
+                if athlete_age == "N/A":
+                    #the slice can hold game names when the born value had fewer than 3 parts
+                    raw_birth = athlete_birth if athlete_births is None else athlete_births[athlete_id]
+                    failure = age_failure_reason(raw_birth)
+                    if failure is not None:
+                        quality.record("age_not_calculated", failure, f"{athlete_id}: {' '.join(raw_birth)!r}")
+                    else:
+                        #a computed age of 0 is also written as "N/A", but the date itself was fine
+                        quality.record_age(0, athlete_id, game_year)
+                elif not MIN_PLAUSIBLE_AGE <= athlete_age <= MAX_PLAUSIBLE_AGE:
+                    quality.record_age(athlete_age, athlete_id, game_year)
     return athlete_age_during_game
 
-def add_age_to_athelete(athlete_ages):
+def age_failure_reason(birth_parts):
+    """
+    Explains why calculate_age cannot use a birth date
+
+    Args:
+        lst[str]: the born value split as in create_birth_dict
+    Returns:
+        str or None: "missing_birth", "partial_birth" (e.g. '1879' or 'July 1882')
+        or "unknown_month", None if the birth date is usable
+    """
+    if not "".join(birth_parts).strip():
+        return "missing_birth"
+    if len(birth_parts) < 3:
+        return "partial_birth"
+    if birth_parts[1].lower() not in MONTHS:
+        return "unknown_month"
+    return None
+
+def athlete_age_for_game(games_date, athlete_birth, game):
+    """
+    Calculates the age of one athlete during one olympic game
+
+    Args:
+        dict: games info
+        lst[str]: athlete birthday
+        str: normalized olympic game containing year
+    Returns:
+        int or str: athlete age, or "N/A" if it could not be calculated
+    """
+    athlete_age = calculate_age(games_date[game], athlete_birth, game)
+    if athlete_age == 0:
+        return "N/A"
+    return athlete_age
+
+def add_age_to_athelete(athlete_ages, partition_by=None, partition_dir=PARTITION_DIR, max_open=MAX_OPEN_FILES,
+                        quality=None):
     """This function parses througth the olympic_athlete_event_results.csv and 
-    adds an age column to every athelte"""
+    adds an age column to every athelte
+
+    With partition_by set to "edition" or "decade" the rows are written to one file
+    per partition inside partition_dir, plus an index.csv, instead of one big file"""
 
     old_file = "olympic_athlete_event_results.csv"
     new_file = "new_olympic_athlete_event_results.csv"
 
-    with open(old_file, newline='', encoding='utf-8') as infile, \
-        open(new_file, "w", newline='', encoding='utf-8') as outfile:
+    with open(old_file, newline='', encoding='utf-8') as infile:
 
         reader = csv.DictReader(infile)
         fieldnames = reader.fieldnames + ["age"]
 
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for row in reader:
-
-            game = row["\ufeffedition"].replace("Olympics", "").strip()
-            id = row["athlete_id"]
-            if (game in athlete_ages):
-                if(id in athlete_ages[game]):
-                    row["age"] = athlete_ages[game][id]
-            else:
-                row["age"] = "N/A"
+        if partition_by is None:
+            with open(new_file, "w", newline='', encoding='utf-8') as outfile:
+                writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+                writer.writeheader()
+                write_rows_with_age(reader, writer, athlete_ages, quality)
+            print(f"CSV file '{new_file}' created successfully.")
+        else:
+            with PartitionedWriter(partition_dir, fieldnames, partition_by, EDITION_COLUMN, max_open) as writer:
+                write_rows_with_age(reader, writer, athlete_ages, quality)
+            print(f"CSV partitions by {partition_by} created successfully in '{partition_dir}'.")
+            #the single file (or task1's placeholder with blank ages) is not produced in this mode
+            if os.path.exists(new_file):
+                os.remove(new_file)
+                print(f"Removed '{new_file}', event results with ages are only in '{partition_dir}'.")
+
+def write_rows_with_age(reader, writer, athlete_ages, quality=None):
+    for row in reader:
+
+        game = row[EDITION_COLUMN].replace("Olympics", "").strip()
+        id = row["athlete_id"]
+        if (game in athlete_ages):
+            if(id in athlete_ages[game]):
+                row["age"] = athlete_ages[game][id]
+                if quality is not None and row["age"] == "N/A":
+                    quality.record("event_without_age", "age_not_calculated", f"{id} @ {game}")
+            elif quality is not None:
+                #athlete missing from the bio file, or the game was read as part of the birth date
+                quality.record("event_without_age", "athlete_not_aged", f"{id} @ {game}")
+        else:
+            row["age"] = "N/A"
+            if quality is not None:
+                quality.record("event_without_age", "unknown_edition", f"{id} @ {game}")
 
-            writer.writerow(row)
-    print(f"CSV file '{new_file}' created successfully.")
+        writer.writerow(row)
 #________________________________________
 #ADDING TO OLYMPIC ATHLETE EVEENT CSV END
 #________________________________________
@@ -211,72 +304,152 @@ def parse_olympics_country():
             noc_to_country[row[0]] = row[1]
     return noc_to_country
 
-def tally_event_info(countries):
+def tally_event_info(countries, quality=None):
     event_tally = {}
     with open(ATHLETE_EVENT_FILE, 'r', newline='', encoding='utf-8') as event_csv:
         reader = csv.DictReader(event_csv)
         for row in reader:
-            if row["edition_id"] not in event_tally:
-                event_tally[row["edition_id"]] = {
-                    "edition": row["\ufeffedition"],
-                    "country": countries[row["country_noc"]],
-                    "country_noc": row["country_noc"],
-                    "number_of_athletes": 0,
-                    "gold_medal_count": 0,
-                    "silver_medal_count": 0,
-                    "bronze_medal_count": 0,
-                    "total_medals": 0
-                }
-            event_tally[row["edition_id"]]["number_of_athletes"] += 1
-            if row["medal"] == "Gold":
-                event_tally[row["edition_id"]]["gold_medal_count"] += 1
-                event_tally[row["edition_id"]]["total_medals"] += 1
-
-            elif row["medal"] == "Silver":
-                event_tally[row["edition_id"]]["silver_medal_count"] += 1
-                event_tally[row["edition_id"]]["total_medals"] += 1
-
-            elif row["medal"] == "Bronze":
-                event_tally[row["edition_id"]]["bronze_medal_count"] += 1
-                event_tally[row["edition_id"]]["total_medals"] += 1
+            if quality is not None and row["country_noc"] not in countries:
+                quality.record("missing_noc", row["country_noc"], row[EDITION_COLUMN])
+            tally_event_row(event_tally, row, countries)
 
     return event_tally
 
-def add_results_to_summary(tally):
-    filename = "new_medal_tally.csv"
-    headers = ["edition", "edition_id", "Country", "NOC", "number_of_athletes", 
-               "gold_medal_count", "silver_medal_count", "bronze_medal_count", "total_medals"]
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(headers)
-        for id in tally:
-            summary_info = tally[id]
-            writer.writerow([summary_info["edition"], 
-                                id, summary_info["country"], 
-                                summary_info["country_noc"], 
-                                summary_info["number_of_athletes"], 
-                                summary_info["gold_medal_count"], 
-                                summary_info["silver_medal_count"], 
-                                summary_info["bronze_medal_count"],
-                                summary_info["total_medals"]])
+def tally_event_row(event_tally, row, countries):
+    """
+    Adds a single event result row to the running medal tally
+
+    Args:
+        dict: medal tally keyed by (edition id, noc)
+        dict: event result row
+        dict: noc to country name
+    Returns:
+        dict: the tally entry the row was counted in
+    """
+    tally_key = (row["edition_id"], row["country_noc"])
+    if tally_key not in event_tally:
+        event_tally[tally_key] = {
+            "edition": row[EDITION_COLUMN],
+            "country": countries.get(row["country_noc"], ""),
+            "country_noc": row["country_noc"],
+            "number_of_athletes": 0,
+            "gold_medal_count": 0,
+            "silver_medal_count": 0,
+            "bronze_medal_count": 0,
+            "total_medals": 0
+        }
+    summary_info = event_tally[tally_key]
+    summary_info["number_of_athletes"] += 1
+    if row["medal"] == "Gold":
+        summary_info["gold_medal_count"] += 1
+        summary_info["total_medals"] += 1
+
+    elif row["medal"] == "Silver":
+        summary_info["silver_medal_count"] += 1
+        summary_info["total_medals"] += 1
+
+    elif row["medal"] == "Bronze":
+        summary_info["bronze_medal_count"] += 1
+        summary_info["total_medals"] += 1
+
+    return summary_info
+
+def tally_sort_key(row):
+    """Sort key for summary rows: numeric edition id first, then NOC"""
+    edition_id = str(row[1])
+    if edition_id.isdigit():
+        return (0, int(edition_id), "", row[3])
+    return (1, 0, edition_id, row[3])
+
+def tally_rows(tally):
+    """
+    Turns the tally dictionary into summary rows sorted by (edition_id, NOC)
+
+    Args:
+        dict: medal tally keyed by (edition id, noc)
+    Returns:
+        lst[list]: summary rows in TALLY_HEADERS order
+    """
+    rows = []
+    for (id, noc), summary_info in tally.items():
+        rows.append([summary_info["edition"], 
+                     id, summary_info["country"], 
+                     summary_info["country_noc"], 
+                     summary_info["number_of_athletes"], 
+                     summary_info["gold_medal_count"], 
+                     summary_info["silver_medal_count"], 
+                     summary_info["bronze_medal_count"],
+                     summary_info["total_medals"]])
+    rows.sort(key=tally_sort_key)
+    return rows
+
+def read_tally_partition(filename):
+    """Yields the rows of a sorted partial tally csv, skipping the header"""
+    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader, None)
+        yield from reader
+
+def merge_tally_partitions(partitions):
+    """
+    Streams a k-way merge of partial tallies that are each already sorted by
+    tally_sort_key. Rows sharing an (edition_id, NOC) key have their counts summed.
 
+    Args:
+        lst[iterable]: sorted summary rows from each partition
+    Returns:
+        generator: merged summary rows, still sorted
+    """
+    current = None
+    current_key = None
+    for row in heapq.merge(*partitions, key=tally_sort_key):
+        key = tally_sort_key(row)
+        if key == current_key:
+            current[4:] = [int(total) + int(count) for total, count in zip(current[4:], row[4:])]
+            continue
+        if current is not None:
+            yield current
+        current = list(row)
+        current_key = key
+    if current is not None:
+        yield current
+
+def write_tally_rows(rows, filename=TALLY_FILE, batch_size=WRITE_BATCH_SIZE):
+    """Writes the summary header and rows using batched writerows calls"""
+    rows = iter(rows)
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(TALLY_HEADERS)
+        batch = list(itr.islice(rows, batch_size))
+        while batch:
+            writer.writerows(batch)
+            batch = list(itr.islice(rows, batch_size))
+
+def merge_tally_files(partition_files, filename=TALLY_FILE):
+    """Combines sorted partial tally files written by parallel jobs into one summary file"""
+    write_tally_rows(merge_tally_partitions([read_tally_partition(f) for f in partition_files]), filename)
+    print(f"CSV file '{filename}' created successfully.")
 
+def add_results_to_summary(tally, filename=TALLY_FILE):
+    write_tally_rows(tally_rows(tally), filename)
     print(f"CSV file '{filename}' created successfully.")
 #_________________________
 #CREATING SUMMARY FILE END
 #_________________________
 
-def task3_main():
+def task3_main(quality=None, partition_by=None, partition_dir=PARTITION_DIR, max_open=MAX_OPEN_FILES):
 
 #Fucntions used to add age
-    athlete = create_age_dict()
+    births = create_birth_dict()
+    athlete = create_age_dict(births)
     games = create_games_dict()
-    athlete_ages = add_athlete_to_games_dict(games, athlete)
-    add_age_to_athelete(athlete_ages)
+    athlete_ages = add_athlete_to_games_dict(games, athlete, quality, births)
+    add_age_to_athelete(athlete_ages, partition_by, partition_dir, max_open, quality)
 
 #Functions used to summarize tallies
     countries = parse_olympics_country()
-    tally = tally_event_info(countries)
+    tally = tally_event_info(countries, quality)
     add_results_to_summary(tally)
 
-task3_main()
+if __name__ == "__main__":
+    task3_main()
@@ -0,0 +1,30 @@
+import pytest
+
+from verify import compare, generated_cases, hot_paths, measure_slowdown, real_cases
+
+MAX_SLOWDOWN = 1.5 #current implementation vs frozen reference, on the same inputs
+TIMING_REPEATS = 7
+
+HOT_PATHS = hot_paths()
+hot_path = pytest.mark.parametrize("name, case_set, reference, candidate", HOT_PATHS,
+                                   ids=[path[0] for path in HOT_PATHS])
+
+@hot_path
+def test_matches_reference_on_generated_inputs(name, case_set, reference, candidate):
+    assert compare(name, reference, candidate, generated_cases(case_set)) == []
+
+@hot_path
+def test_matches_reference_on_real_csvs(name, case_set, reference, candidate):
+    cases = real_cases(case_set)
+    if not cases:
+        pytest.skip("olympic_athlete_bio.csv is not present")
+    assert compare(name, reference, candidate, cases) == []
+
+@hot_path
+def test_not_slower_than_reference(name, case_set, reference, candidate):
+    reference_time, candidate_time, ratio = measure_slowdown(
+        reference, candidate, generated_cases(case_set), TIMING_REPEATS)
+    assert ratio <= MAX_SLOWDOWN, (
+        f"{name} took {candidate_time * 1000:.1f} ms against {reference_time * 1000:.1f} ms "
+        f"for the reference ({ratio:.2f}x, limit {MAX_SLOWDOWN}x)"
+    )
@@ -0,0 +1,56 @@
+import csv
+import os
+
+import pytest
+
+from partition import PartitionedWriter, read_partition_index
+
+FIELDNAMES = ["edition", "athlete_id", "age"]
+ROWS = [
+    {"edition": "1896 Summer Olympics", "athlete_id": "1", "age": "23"},
+    {"edition": "1900 Summer Olympics", "athlete_id": "2", "age": "25"},
+    {"edition": "1904 Summer Olympics", "athlete_id": "3", "age": "N/A"},
+    {"edition": "1896 Summer Olympics", "athlete_id": "4", "age": "30"},
+]
+
+def _write(directory, partition_by, max_open=32):
+    with PartitionedWriter(str(directory), FIELDNAMES, partition_by, max_open=max_open) as writer:
+        for row in ROWS:
+            writer.writerow(row)
+
+def test_index_matches_partition_files(tmp_path):
+    _write(tmp_path, "edition", max_open=1)
+
+    index = read_partition_index(str(tmp_path))
+    assert [(entry["partition"], entry["rows"]) for entry in index] == [
+        ("1896_summer_olympics", "2"), ("1900_summer_olympics", "1"), ("1904_summer_olympics", "1"),
+    ]
+    for entry in index:
+        path = tmp_path / entry["file"]
+        assert os.path.getsize(path) == int(entry["bytes"])
+        with open(path, "rb") as fh:
+            fh.seek(int(entry["data_offset"]))
+            assert len(list(csv.reader(fh.read().decode("utf-8").splitlines()))) == int(entry["rows"])
+
+def test_rerun_removes_partitions_from_an_earlier_mode(tmp_path):
+    _write(tmp_path, "decade")
+    _write(tmp_path, "edition")
+
+    files = sorted(os.listdir(tmp_path))
+    assert files == ["1896_summer_olympics.csv", "1900_summer_olympics.csv",
+                     "1904_summer_olympics.csv", "index.csv"]
+
+def test_refuses_directory_with_unrelated_csv_files(tmp_path):
+    (tmp_path / "olympics_games.csv").write_text("edition\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        _write(tmp_path, "edition")
+    assert (tmp_path / "olympics_games.csv").exists()
+
+def test_failed_run_leaves_the_index_empty(tmp_path):
+    with pytest.raises(RuntimeError):
+        with PartitionedWriter(str(tmp_path), FIELDNAMES, "edition") as writer:
+            writer.writerow(ROWS[0])
+            raise RuntimeError("interrupted")
+
+    assert read_partition_index(str(tmp_path)) == []
@@ -0,0 +1,98 @@
+import json
+
+from quality import QualityReport, date_shape
+from task2 import DataCleaner
+from task3 import EDITION_COLUMN, add_athlete_to_games_dict, write_rows_with_age
+
+GAMES_DATE = {
+    "1896 Summer": "6 – 13 April",
+    "1972 Summer": "26 August – 11 September",
+}
+
+def test_date_shape_groups_similar_dates():
+    assert date_shape("04-Apr-49") == "99-a-99"
+    assert date_shape(" 24 November 1873 ") == "99 a 9999"
+
+def test_computed_age_of_zero_is_reported_as_implausible_not_unparsed():
+    quality = QualityReport()
+    ages = add_athlete_to_games_dict(GAMES_DATE, {"1": ["12", "Jul", "72", "1972 Summer"]}, quality)
+
+    assert ages["1972 Summer"]["1"] == "N/A"
+    report = quality.to_dict()
+    assert "age_not_calculated" not in report
+    assert report["implausible_age"]["by_key"]["under_10"]["count"] == 1
+
+def test_unusable_birth_date_is_reported_from_the_raw_born_value():
+    quality = QualityReport()
+    #create_age_dict appends games right after the split born value, so short
+    #births leave game names where the month and year should be
+    births = {"2": ["1879"], "3": [""], "4": ["12", "Foo", "1870"]}
+    athlete_info = {
+        "2": ["1879", "1896 Summer", "1972 Summer", "1896 Summer"],
+        "3": ["", "1896 Summer", "1972 Summer", "1972 Summer"],
+        "4": ["12", "Foo", "1870", "1896 Summer"],
+    }
+    ages = add_athlete_to_games_dict(GAMES_DATE, athlete_info, quality, births)
+
+    assert ages["1896 Summer"]["2"] == "N/A"
+    by_key = quality.to_dict()["age_not_calculated"]["by_key"]
+    assert {key: entry["count"] for key, entry in by_key.items()} == {
+        "partial_birth": 1, "missing_birth": 1, "unknown_month": 1,
+    }
+    assert by_key["partial_birth"]["examples"] == ["2: '1879'"]
+    assert "implausible_age" not in quality.to_dict()
+
+def test_event_rows_left_without_age_are_recorded():
+    quality = QualityReport()
+    athlete_ages = {"1896 Summer": {"1": 23, "2": "N/A"}}
+    rows = [
+        {EDITION_COLUMN: "1896 Summer Olympics", "athlete_id": "1"},
+        {EDITION_COLUMN: "1896 Summer Olympics", "athlete_id": "2"},
+        {EDITION_COLUMN: "1896 Summer Olympics", "athlete_id": "3"},
+        {EDITION_COLUMN: "1906 Intercalated Olympics", "athlete_id": "1"},
+    ]
+    written = []
+
+    class ListWriter:
+        def writerow(self, row):
+            written.append(row)
+
+    write_rows_with_age(rows, ListWriter(), athlete_ages, quality)
+
+    assert [row.get("age", "") for row in written] == [23, "N/A", "", "N/A"]
+    by_key = quality.to_dict()["event_without_age"]["by_key"]
+    assert {key: entry["count"] for key, entry in by_key.items()} == {
+        "age_not_calculated": 1, "athlete_not_aged": 1, "unknown_edition": 1,
+    }
+
+def test_bare_dash_competition_date_is_missing_not_unparseable():
+    quality = QualityReport()
+    cleaner = DataCleaner(quality)
+
+    assert cleaner.clean_competition_date("—", "1906") == ""
+    assert cleaner.clean_competition_date(" - ", "1906") == ""
+    assert "unparseable_competition_date" not in quality.to_dict()
+
+def test_partial_run_only_replaces_its_own_categories(tmp_path):
+    filename = str(tmp_path / "report.json")
+    full = QualityReport()
+    full.record("unparseable_birthdate", "99-a-99", "04-Apr-49")
+    full.record("missing_noc", "ZZZ", "1896 Summer Olympics")
+    full.write(filename)
+
+    task3_only = QualityReport()
+    task3_only.record("unknown_edition", "1906 Summer", "7")
+    task3_only.write(filename, ["task3"])
+
+    with open(filename, encoding="utf-8") as fh:
+        report = json.load(fh)
+    assert sorted(report) == ["unknown_edition", "unparseable_birthdate"]
+
+def test_reservoir_keeps_a_bounded_sample():
+    quality = QualityReport(sample_size=3)
+    for i in range(100):
+        quality.record("missing_noc", "ZZZ", str(i))
+
+    entry = quality.to_dict()["missing_noc"]["by_key"]["ZZZ"]
+    assert entry["count"] == 100
+    assert len(entry["examples"]) == 3
@@ -0,0 +1,113 @@
+import csv
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from service import OlympicIndex, ServiceClient, start_in_thread
+
+GAMES_HEADER = ["edition", "edition_id", "edition_url", "year", "city", "country_flag_url",
+                "country_noc", "start_date", "end_date", "competition_date", "isHeld"]
+BIO_HEADER = ["athlete_id", "name", "sex", "born", "height", "weight", "country",
+              "country_noc", "description", "special_notes"]
+EVENT_HEADER = ["edition", "edition_id", "country_noc", "sport", "event", "result_id",
+                "athlete", "athlete_id", "pos", "medal", "isTeamSport"]
+
+def _write_csv(path, header, rows, encoding="utf-8"):
+    with open(path, "w", newline="", encoding=encoding) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    _write_csv(tmp_path / "olympics_country.csv", ["noc", "country"],
+               [["GRE", "Greece"], ["USA", "United States"]])
+    _write_csv(tmp_path / "olympics_games.csv", GAMES_HEADER, [
+        ["1896 Summer Olympics", "1", "/editions/1", "1896", "Athina", "", "GRE", "", "", "6 – 13 April", ""],
+        ["1900 Summer Olympics", "2", "/editions/2", "1900", "Paris", "", "FRA", "", "", "14 May – 28 October", ""],
+    ])
+    _write_csv(tmp_path / "olympic_athlete_bio.csv", BIO_HEADER, [
+        ["1", "Spyridon Louis", "Male", "12 January 1873", "", "", "Greece", "GRE", "", ""],
+        ["2", "Thomas Burke", "Male", "15-Jan-1875", "", "", "United States", "USA", "", ""],
+        ["3", "Bad Date", "Male", "12 Foo 1870", "", "", "Greece", "GRE", "", ""],
+    ])
+    #the real event file starts with a BOM; seeding from it exercises that header
+    _write_csv(tmp_path / "olympic_athlete_event_results.csv", EVENT_HEADER, [], encoding="utf-8-sig")
+
+    monkeypatch.chdir(tmp_path)
+    server = start_in_thread(port=0, index=OlympicIndex(seed_tally=True))
+    try:
+        yield ServiceClient(port=server.server_port)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def _event(athlete_id, edition="1896 Summer Olympics", edition_id="1", noc="GRE", medal=""):
+    return {"edition": edition, "edition_id": edition_id, "country_noc": noc, "sport": "Athletics",
+            "event": "Marathon", "result_id": "1", "athlete": "", "athlete_id": athlete_id,
+            "pos": "1", "medal": medal, "isTeamSport": "False"}
+
+def _post_raw(client, data):
+    request = urllib.request.Request(client.base_url + "/events", data=data, method="POST")
+    request.add_header("Content-Type", "application/json")
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request, timeout=client.timeout)
+    return error.value.code, json.loads(error.value.read())
+
+def test_health_counts_loaded_tables(client):
+    #parse_olympics_country keeps the "noc,country" header row as an entry
+    assert client.health() == {"athletes": 3, "games": 2, "countries": 3}
+
+def test_events_are_enriched_with_age_and_tally_delta(client):
+    result = client.send_events([
+        _event("1", medal="Gold"),
+        _event("2", noc="USA", medal="Silver"),
+        _event("3"),
+        _event("99", edition="1900 Summer Olympics", edition_id="2", noc="USA"),
+    ])
+
+    assert [row["age"] for row in result["rows"]] == [23, 21, "N/A", "N/A"]
+    assert result["rows"][0]["edition"] == "1896 Summer Olympics"
+    assert result["tally_delta"] == [
+        ["1896 Summer Olympics", "1", "Greece", "GRE", 2, 1, 0, 0, 1],
+        ["1896 Summer Olympics", "1", "United States", "USA", 1, 0, 1, 0, 1],
+        ["1900 Summer Olympics", "2", "United States", "USA", 1, 0, 0, 0, 0],
+    ]
+
+def test_tally_adds_up_across_batches(client):
+    client.send_events([_event("1", medal="Gold"), _event("2", noc="USA", medal="Bronze")])
+    second = client.send_events([_event("3", medal="Silver")])
+
+    assert second["tally_delta"] == [["1896 Summer Olympics", "1", "Greece", "GRE", 1, 0, 1, 0, 1]]
+    assert client.tally() == [
+        ["1896 Summer Olympics", "1", "Greece", "GRE", 2, 1, 1, 0, 2],
+        ["1896 Summer Olympics", "1", "United States", "USA", 1, 0, 0, 1, 1],
+    ]
+
+def test_non_object_body_is_rejected(client):
+    status, payload = _post_raw(client, b"[1, 2]")
+    assert status == 400
+    assert "bad event rows" in payload["error"]
+
+@pytest.mark.parametrize("data", [b'{"rows": 5}', b'{"rows": [1]}', b'{"rows": [null]}'])
+def test_rows_that_are_not_a_list_of_objects_are_rejected(client, data):
+    status, payload = _post_raw(client, data)
+    assert status == 400
+    assert "list of objects" in payload["error"]
+    assert client.tally() == []
+
+def test_row_missing_athlete_id_is_rejected(client):
+    row = _event("1")
+    del row["athlete_id"]
+    with pytest.raises(urllib.error.HTTPError) as error:
+        client.send_events([row])
+    assert error.value.code == 400
+    assert "athlete_id" in json.loads(error.value.read())["error"]
+    assert client.tally() == []
+
+def test_invalid_json_is_rejected(client):
+    status, payload = _post_raw(client, b"{not json")
+    assert status == 400
+    assert "bad event rows" in payload["error"]
@@ -0,0 +1,65 @@
+import csv
+
+from task3 import (TALLY_HEADERS, merge_tally_files, merge_tally_partitions, tally_rows,
+                   tally_sort_key, write_tally_rows)
+
+def _row(edition_id, noc, athletes=1, gold=0, silver=0, bronze=0):
+    return [f"Games {edition_id}", edition_id, f"Country {noc}", noc,
+            athletes, gold, silver, bronze, gold + silver + bronze]
+
+def _summary(edition_id, noc, athletes=1, gold=0):
+    return {"edition": f"Games {edition_id}", "country": f"Country {noc}", "country_noc": noc,
+            "number_of_athletes": athletes, "gold_medal_count": gold, "silver_medal_count": 0,
+            "bronze_medal_count": 0, "total_medals": gold}
+
+def _read(filename):
+    with open(filename, newline="", encoding="utf-8") as fh:
+        return list(csv.reader(fh))
+
+def test_edition_ids_sort_numerically_then_non_numeric():
+    rows = [_row("10", "USA"), _row("x1", "GRE"), _row("9", "USA"), _row("2", "USA"), _row("9", "GRE")]
+
+    assert [(row[1], row[3]) for row in sorted(rows, key=tally_sort_key)] == [
+        ("2", "USA"), ("9", "GRE"), ("9", "USA"), ("10", "USA"), ("x1", "GRE"),
+    ]
+
+def test_tally_rows_are_sorted_by_edition_id_and_noc():
+    tally = {("10", "USA"): _summary("10", "USA"), ("2", "USA"): _summary("2", "USA"),
+             ("9", "USA"): _summary("9", "USA"), ("9", "GRE"): _summary("9", "GRE")}
+
+    assert [(row[1], row[3]) for row in tally_rows(tally)] == [
+        ("2", "USA"), ("9", "GRE"), ("9", "USA"), ("10", "USA"),
+    ]
+
+def test_merge_sums_a_key_shared_across_partitions():
+    first = [_row("2", "USA", athletes=3, gold=1), _row("10", "GRE", athletes=1)]
+    second = [_row("2", "USA", athletes=2, silver=2), _row("9", "USA", athletes=4, bronze=1)]
+
+    merged = list(merge_tally_partitions([first, second]))
+
+    assert merged == [
+        ["Games 2", "2", "Country USA", "USA", 5, 1, 2, 0, 3],
+        _row("9", "USA", athletes=4, bronze=1),
+        _row("10", "GRE", athletes=1),
+    ]
+
+def test_merge_tally_files_sums_csv_partitions(tmp_path):
+    first, second = str(tmp_path / "part1.csv"), str(tmp_path / "part2.csv")
+    write_tally_rows([_row("2", "USA", gold=1), _row("10", "USA", gold=1)], first)
+    write_tally_rows([_row("9", "GRE"), _row("10", "USA", athletes=2, gold=2)], second)
+
+    merge_tally_files([first, second], str(tmp_path / "tally.csv"))
+
+    rows = _read(tmp_path / "tally.csv")
+    assert rows[0] == TALLY_HEADERS
+    assert [(row[1], row[3], row[4], row[8]) for row in rows[1:]] == [
+        ("2", "USA", "1", "1"), ("9", "GRE", "1", "0"), ("10", "USA", "3", "3"),
+    ]
+
+def test_batch_smaller_than_row_count_writes_every_row(tmp_path):
+    filename = str(tmp_path / "tally.csv")
+    rows = [_row(str(edition_id), "USA") for edition_id in range(1, 8)]
+
+    write_tally_rows(iter(rows), filename, batch_size=3)
+
+    assert _read(filename) == [TALLY_HEADERS] + [[str(value) for value in row] for row in rows]
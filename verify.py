@@ -0,0 +1,346 @@
+import csv
+import gc
+import os
+import random
+import time
+from datetime import datetime
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --------------------------------------------------------------
+# Reference implementations
+# Frozen copies of the date and age logic as first shipped. Optimised
+# versions in task2/task3 must give the same result (or raise the same
+# exception type) for every input, and must not be much slower.
+# --------------------------------------------------------------
+REFERENCE_MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "september": 9, "oct": 10, "october": 10,
+    "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+
+def reference_clean_birthdate(date_str):
+    if date_str is None:
+        return ""
+    s = str(date_str).strip()
+    if s == "" or s.lower() in ["unknown", "na", "n/a", "nan", "none"]:
+        return ""
+
+    parts = s.split("-")
+    if len(parts) == 3 and len(parts[2]) == 2 and parts[2].isdigit():
+        day_str, mon_str, yy_str = parts
+        yy = int(yy_str)
+        full_year = 2000 + yy if 0 <= yy <= 22 else 1900 + yy
+        try:
+            return datetime.strptime(f"{day_str}-{mon_str}-{full_year}", "%d-%b-%Y").strftime("%d-%b-%Y")
+        except ValueError:
+            pass
+
+    for fmt in ["%d-%b-%Y", "%d %B %Y", "%d %b %Y"]:
+        try:
+            return datetime.strptime(s, fmt).strftime("%d-%b-%Y")
+        except ValueError:
+            pass
+
+    for fmt in ["%B %Y", "%b %Y"]:
+        try:
+            return datetime.strptime(s, fmt).replace(day=1).strftime("%d-%b-%Y")
+        except ValueError:
+            pass
+
+    if s.isdigit() and len(s) == 4:
+        try:
+            return datetime(int(s), 1, 1).strftime("%d-%b-%Y")
+        except ValueError:
+            return ""
+    return ""
+
+def reference_format_single_date(s, year):
+    try:
+        dt = datetime.strptime(f"{s} {year}", "%d %B %Y")
+    except ValueError:
+        try:
+            dt = datetime.strptime(f"{s} {year}", "%d %b %Y")
+        except ValueError:
+            return ""
+    return dt.strftime("%d-%b-%Y")
+
+def reference_clean_competition_date(date_str, year):
+    if date_str is None or str(date_str).strip() == "":
+        return ""
+    raw = str(date_str).strip()
+    for dash in ["–", "—", "−"]:
+        raw = raw.replace(dash, "-")
+    raw = raw.replace(" - ", " to ").replace("-", " to ")
+    while "  " in raw:
+        raw = raw.replace("  ", " ")
+
+    if " to " not in raw:
+        return reference_format_single_date(raw, year)
+
+    start_str, end_str = raw.split(" to ", 1)
+    start_str = start_str.strip()
+    end_str = end_str.strip()
+    end_parts = end_str.split()
+    if len(start_str.split()) == 1 and len(end_parts) == 2:
+        start_str = f"{start_str} {end_parts[1]}"
+
+    start_clean = reference_format_single_date(start_str, year)
+    end_clean = reference_format_single_date(end_str, year)
+    if not start_clean or not end_clean:
+        return ""
+    return f"{start_clean} to {end_clean}"
+
+def reference_parse_game_duration(s):
+    s = s.replace("–", "-")
+    start_part, end_part = [p.strip() for p in s.split("-")]
+    start_tokens = start_part.split()
+    end_tokens = end_part.split()
+    if len(start_tokens) == 2:
+        return [start_tokens[0], start_tokens[1].lower(), end_tokens[0], end_tokens[1].lower()]
+    end_month = end_tokens[1].lower()
+    return [start_tokens[0], end_month, end_tokens[0], end_month]
+
+def reference_calculate_age(game_duration, athlete_birth, game_year):
+    game_duration = reference_parse_game_duration(game_duration)
+    game_year = int(game_year.split(' ')[0])
+    if athlete_birth[1].lower() not in REFERENCE_MONTHS:
+        return 0
+    start_date = datetime(game_year, REFERENCE_MONTHS[game_duration[1].lower()], int(game_duration[0]))
+    end_date = datetime(game_year, REFERENCE_MONTHS[game_duration[3].lower()], int(game_duration[2]))
+    athlete_year = int(athlete_birth[2])
+    if athlete_year < 100:
+        athlete_year += 1900
+    athlete_date = datetime(athlete_year, REFERENCE_MONTHS[athlete_birth[1].lower()], int(athlete_birth[0]))
+
+    age = (((start_date - athlete_date) / 365).days)
+    if start_date <= athlete_date <= end_date:
+        age -= 1
+    return age
+
+# --------------------------------------------------------------
+# Generated inputs
+# --------------------------------------------------------------
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+DASHES = ["–", "—", "−", "-"]
+
+def _month(rng):
+    name = rng.choice(MONTH_NAMES)
+    return rng.choice([name, name[:3], name.lower(), name.upper(), "Sept", "Foo"])
+
+def generate_birthdates(rng, count):
+    """Birthdates in every shape the cleaner handles, near misses and junk"""
+    values = ["", "  ", "unknown", "NA", "n/a", "nan", "None", None, "29 February 1900",
+              "29 February 1896", "29-Feb-00", "31-Apr-49", "00-Jan-22", "0000", "1879", "12345"]
+    while len(values) < count:
+        day, year = rng.randint(0, 32), rng.randint(1, 2030)
+        values.append(rng.choice([
+            f"{day:02d}-{_month(rng)[:3]}-{year % 100:02d}",
+            f"{day}-{_month(rng)}-{year}",
+            f"{day} {_month(rng)} {year}",
+            f" {day} {_month(rng)} {year} ",
+            f"{_month(rng)} {year}",
+            f"{year}",
+            f"c. {year}",
+            f"{day}/{rng.randint(1, 12)}/{year}",
+            "".join(rng.choice("0123456789 -abcJanFeb") for _ in range(rng.randint(0, 12))),
+        ]))
+    return values
+
+def generate_competition_dates(rng, count):
+    """Competition date ranges with every dash variant, plus malformed ones"""
+    values = [("", "1900"), (None, "1900"), ("—", "1916"), ("6 – 13 April", "1896"),
+              ("29 February", "1900"), ("29 February", "1904"), ("21 July –  8 August 2021", "2020")]
+    while len(values) < count:
+        start, end = rng.randint(0, 32), rng.randint(0, 32)
+        dash = rng.choice(DASHES)
+        year = str(rng.randint(1896, 2030))
+        values.append((rng.choice([
+            f"{start} {dash} {end} {_month(rng)}",
+            f"{start} {_month(rng)} {dash} {end} {_month(rng)}",
+            f" {start} {_month(rng)}{dash}{end} {_month(rng)} ",
+            f"{start} {_month(rng)}",
+            f"{start}  {dash}  {end} {_month(rng)}",
+            dash,
+        ]), rng.choice([year, year, "", "19xx"])))
+    return values
+
+def generate_durations(rng, count):
+    """Game durations as parse_game_duration sees them in olympics_games.csv"""
+    values = ["6 – 13 April", "14 May – 28 October", "—", "1 July", "29 January – 5 February"]
+    while len(values) < count:
+        start, end = rng.randint(1, 28), rng.randint(1, 28)
+        values.append(rng.choice([
+            f"{start} – {end} {_month(rng)}",
+            f"{start} {_month(rng)} – {end} {_month(rng)}",
+            f"{start} {_month(rng)} - {end} {_month(rng)}",
+            f"{start} {_month(rng)}",
+        ]))
+    return values
+
+def generate_ages(rng, count):
+    """(game_duration, athlete_birth, game_year) triples, including leap days and bad births"""
+    durations = generate_durations(rng, count)
+    values = [("6 – 13 April", ["29", "Feb", "1872"], "1896 Summer"),
+              ("6 – 13 April", ["6", "April", "1876"], "1896 Summer"),
+              ("6 – 13 April", ["1879"], "1896 Summer"),
+              ("6 – 13 April", ["04", "Apr", "49"], "1952 Summer")]
+    while len(values) < count:
+        game_year = rng.randint(1896, 2024)
+        birth = [str(rng.randint(1, 31)), _month(rng), str(rng.choice([game_year - rng.randint(-2, 80), rng.randint(0, 99)]))]
+        values.append((rng.choice(durations), birth[:rng.choice([3, 3, 3, 2, 1])],
+                       f"{game_year} {rng.choice(['Summer', 'Winter'])}"))
+    return values
+
+GAMES_FILE = os.path.join(PACKAGE_DIR, "olympics_games.csv")
+BIO_FILE = os.path.join(PACKAGE_DIR, "olympic_athlete_bio.csv")
+
+def generated_cases(name, examples=2000, seed=0):
+    """Argument tuples for the named hot path, generated from a fixed seed"""
+    rng = random.Random(seed)
+    if name == "clean_birthdate":
+        return [(value,) for value in generate_birthdates(rng, examples)]
+    if name == "clean_competition_date":
+        return generate_competition_dates(rng, examples)
+    if name == "parse_game_duration":
+        return [(value,) for value in generate_durations(rng, examples)]
+    if name == "calculate_age":
+        return generate_ages(rng, examples)
+    raise ValueError(f"unknown hot path {name!r}")
+
+def _read_column(filename, *columns):
+    with open(filename, newline="", encoding="utf-8") as fh:
+        return [tuple(row[column] for column in columns) for row in csv.DictReader(fh)]
+
+def real_cases(name):
+    """
+    Argument tuples for the named hot path taken from the csv files next to
+    this module. Returns an empty list when a needed file is missing.
+    """
+    needs_bio = name in ["clean_birthdate", "calculate_age"]
+    if needs_bio and not os.path.exists(BIO_FILE):
+        return []
+    if name == "clean_birthdate":
+        return _read_column(BIO_FILE, "born")
+    if name == "clean_competition_date":
+        return _read_column(GAMES_FILE, "competition_date", "year")
+    if name == "parse_game_duration":
+        return _read_column(GAMES_FILE, "competition_date")
+    if name == "calculate_age":
+        #pair every athlete with one game, split the way create_birth_dict does
+        games = _read_column(GAMES_FILE, "edition", "competition_date")
+        cases = []
+        for i, (born,) in enumerate(_read_column(BIO_FILE, "born")):
+            edition, duration = games[i % len(games)]
+            birth = born.split("-") if "-" in born else born.split(" ")
+            cases.append((duration, birth, edition.replace("Olympics", "").strip()))
+        return cases
+    raise ValueError(f"unknown hot path {name!r}")
+
+# --------------------------------------------------------------
+# Differential checks
+# --------------------------------------------------------------
+def _outcome(func, args):
+    try:
+        return ("ok", func(*args))
+    except Exception as error:
+        return ("error", type(error).__name__)
+
+def compare(name, reference, candidate, cases):
+    """
+    Runs reference and candidate on every case
+
+    Args:
+        str: name used in the report
+        function: frozen reference implementation
+        function: implementation under test
+        lst[tuple]: argument tuples
+    Returns:
+        lst[str]: one message per mismatch
+    """
+    mismatches = []
+    for args in cases:
+        expected = _outcome(reference, args)
+        actual = _outcome(candidate, args)
+        if expected != actual:
+            mismatches.append(f"{name}{args!r}: expected {expected!r}, got {actual!r}")
+    return mismatches
+
+def _run_cases(func, cases):
+    start_time = time.perf_counter()
+    for args in cases:
+        _outcome(func, args)
+    return time.perf_counter() - start_time
+
+def measure_slowdown(reference, candidate, cases, repeats=5):
+    """
+    Times reference and candidate on the same cases
+
+    Returns:
+        tuple: best reference time, best candidate time (seconds) and candidate/reference ratio
+    """
+    reference_time = None
+    candidate_time = None
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            #Alternate the two runs so drift in machine load hits both equally
+            elapsed = _run_cases(reference, cases)
+            reference_time = elapsed if reference_time is None else min(reference_time, elapsed)
+            elapsed = _run_cases(candidate, cases)
+            candidate_time = elapsed if candidate_time is None else min(candidate_time, elapsed)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    ratio = candidate_time / reference_time if reference_time else 1.0
+    return reference_time, candidate_time, ratio
+
+def hot_paths():
+    """
+    (name, case set, reference, current implementation) for every checked hot path.
+    The cleaner is checked both bare and with a QualityReport attached, since
+    project.py collects quality metrics by default and that changes the failure path.
+    """
+    from quality import QualityReport
+    from task2 import DataCleaner
+    from task3 import calculate_age, parse_game_duration
+    cleaner = DataCleaner()
+    tracked_cleaner = DataCleaner(QualityReport())
+    return [
+        ("clean_birthdate", "clean_birthdate", reference_clean_birthdate, cleaner.clean_birthdate),
+        ("clean_birthdate[quality]", "clean_birthdate", reference_clean_birthdate, tracked_cleaner.clean_birthdate),
+        ("clean_competition_date", "clean_competition_date",
+         reference_clean_competition_date, cleaner.clean_competition_date),
+        ("clean_competition_date[quality]", "clean_competition_date",
+         reference_clean_competition_date, tracked_cleaner.clean_competition_date),
+        ("parse_game_duration", "parse_game_duration", reference_parse_game_duration, parse_game_duration),
+        ("calculate_age", "calculate_age", reference_calculate_age, calculate_age),
+    ]
+
+def verify(examples=2000, seed=0, max_slowdown=1.5, repeats=5):
+    """
+    Command line version of test_hot_paths.py: runs the same differential and
+    timing checks and raises SystemExit on any failure.
+    """
+    failures = []
+    for name, case_set, reference, candidate in hot_paths():
+        cases = generated_cases(case_set, examples, seed) + real_cases(case_set)
+        mismatches = compare(name, reference, candidate, cases)
+        print(f"{name}: {len(cases)} cases, {len(mismatches)} mismatches")
+        failures.extend(mismatches)
+
+        reference_time, candidate_time, ratio = measure_slowdown(reference, candidate, cases, repeats)
+        print(f"{name}: reference {reference_time * 1000:.1f} ms, current {candidate_time * 1000:.1f} ms ({ratio:.2f}x)")
+        if ratio > max_slowdown:
+            failures.append(f"{name} is {ratio:.2f}x slower than the reference, limit is {max_slowdown:.2f}x")
+
+    if failures:
+        raise SystemExit(f"{len(failures)} failures:\n" + "\n".join(failures))
+    print("Verification passed.")
+
+if __name__ == "__main__":
+    verify()